@@ -7,13 +7,24 @@ Evaluates customer support ticket replies using Groq, Grok, or OpenAI LLMs.
 
 import argparse
 import sys
+from typing import TYPE_CHECKING, cast
 
 from dotenv import load_dotenv
 
-from src.config import MODEL_CONFIGS, DEFAULT_MODE, get_available_modes
-from src.csv_handler import read_tickets, write_results
+from src.config import (
+    BATCH_THRESHOLD,
+    MODEL_CONFIGS,
+    DEFAULT_MODE,
+    get_available_modes,
+    get_max_concurrency,
+)
+from src.csv_handler import ResultWriter, read_tickets, write_results
+from src.cache import DEFAULT_CACHE_PATH, ResponseCache
 from src.clients import create_client
-from src.evaluator import evaluate_tickets
+from src.evaluator import evaluate_tickets, evaluate_tickets_batch
+
+if TYPE_CHECKING:
+    from src.clients import OpenAIBatchClient
 
 # Load environment variables
 load_dotenv()
@@ -29,6 +40,7 @@ Examples:
   python evaluate_tickets.py tickets.csv
   python evaluate_tickets.py tickets.csv --model groq-fast
   python evaluate_tickets.py tickets.csv --model openai-balanced --output results.csv
+  python evaluate_tickets.py tickets.csv --model openai-fast --batch
 
 Available modes:
   groq-fast      - Groq (llama-3.3-70b), fastest
@@ -63,6 +75,27 @@ Available modes:
         help="Output file path (default: tickets_evaluated.csv)",
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Use the OpenAI Batch API (50%% cheaper, up to 24h turnaround) "
+            f"when there are more than {BATCH_THRESHOLD} tickets. OpenAI modes only"
+        ),
+    )
+
+    parser.add_argument(
+        "--raw-http",
+        action="store_true",
+        help="Call the API over raw HTTP, skipping SDK response parsing. OpenAI modes only",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't reuse or store responses in the {DEFAULT_CACHE_PATH} cache",
+    )
+
     return parser.parse_args()
 
 
@@ -86,35 +119,47 @@ def main() -> int:
         print(f"Found {len(tickets)} tickets")
         print("-" * 40)
 
-        # Create client
-        client = create_client(args.model)
-
-        # Evaluate
-        results = evaluate_tickets(tickets, client)
-
-        # Write output
-        print("-" * 40)
-        print(f"Writing results to {args.output}...")
-        write_results(args.output, results)
-
-        # Summary
-        successful = [r for r in results if r.content_score > 0]
-        avg_content = (
-            sum(r.content_score for r in successful) / len(successful)
-            if successful
-            else 0
-        )
-        avg_format = (
-            sum(r.format_score for r in successful) / len(successful)
-            if successful
-            else 0
-        )
+        # Create client (a batch client still evaluates small files live)
+        client = create_client(args.model, batch=args.batch, raw_http=args.raw_http)
+
+        # Evaluate and write output
+        if args.batch and len(tickets) > BATCH_THRESHOLD:
+            results = evaluate_tickets_batch(tickets, cast("OpenAIBatchClient", client))
+            print("-" * 40)
+            print(f"Writing results to {args.output}...")
+            write_results(args.output, results)
+        else:
+            # Rows are streamed to the output file as tickets finish
+            print(f"Writing results to {args.output} as they complete...")
+            cache = None if args.no_cache else ResponseCache()
+            try:
+                with ResultWriter(args.output) as writer:
+                    results = evaluate_tickets(
+                        tickets,
+                        client,
+                        get_max_concurrency(args.model),
+                        writer,
+                        cache,
+                    )
+            finally:
+                if cache is not None:
+                    cache.close()
+
+        # Summary (single pass over the results)
+        successful = content_total = format_total = 0
+        for r in results:
+            if r.content_score > 0:
+                successful += 1
+                content_total += r.content_score
+                format_total += r.format_score
+        avg_content = content_total / successful if successful else 0
+        avg_format = format_total / successful if successful else 0
 
         print("-" * 40)
         print("Summary:")
         print(f"  Total tickets: {len(results)}")
-        print(f"  Successful: {len(successful)}")
-        print(f"  Failed: {len(results) - len(successful)}")
+        print(f"  Successful: {successful}")
+        print(f"  Failed: {len(results) - successful}")
         print(f"  Avg content score: {avg_content:.2f}")
         print(f"  Avg format score: {avg_format:.2f}")
         print("-" * 40)
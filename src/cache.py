@@ -0,0 +1,69 @@
+"""Persistent cache of raw LLM responses."""
+
+import hashlib
+import sqlite3
+
+from .prompts import EVALUATION_TEMPLATE, SYSTEM_PROMPT
+
+try:
+    import blake3
+
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+DEFAULT_CACHE_PATH = ".eval_cache.sqlite3"
+
+# Part of every key, so editing the prompts invalidates old entries
+_PROMPT_DIGEST = hashlib.blake2b(
+    (SYSTEM_PROMPT + EVALUATION_TEMPLATE).encode("utf-8"), digest_size=16
+).hexdigest()
+
+
+def make_cache_key(model: str, temperature: float, ticket: str, reply: str) -> bytes:
+    """Build the cache key for an evaluation request."""
+    data = f"{_PROMPT_DIGEST}\0{model}\0{temperature}\0{ticket}\0{reply}".encode(
+        "utf-8"
+    )
+    if HAS_BLAKE3:
+        return blake3.blake3(data).digest()
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+class ResponseCache:
+    """SQLite-backed cache so re-runs skip tickets that were already evaluated."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS eval_cache ("
+            "key BLOB PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(self, key: bytes) -> str | None:
+        """Get a cached raw response, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT response FROM eval_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, key: bytes, response: str) -> None:
+        """Store a raw response."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO eval_cache (key, response) VALUES (?, ?)",
+            (key, response),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
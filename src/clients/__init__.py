@@ -1,9 +1,41 @@
 """LLM clients for different providers."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseLLMClient
-from .groq_client import GroqClient
-from .grok_client import GrokClient
-from .openai_client import OpenAIClient
 from .factory import create_client
 
-__all__ = ["BaseLLMClient", "GroqClient", "GrokClient", "OpenAIClient", "create_client"]
+if TYPE_CHECKING:
+    from .groq_client import GroqClient
+    from .grok_client import GrokClient
+    from .openai_client import OpenAIClient
+    from .openai_batch_client import OpenAIBatchClient
+    from .fast_openai_client import FastOpenAIClient
+
+__all__ = [
+    "BaseLLMClient",
+    "GroqClient",
+    "GrokClient",
+    "OpenAIClient",
+    "OpenAIBatchClient",
+    "FastOpenAIClient",
+    "create_client",
+]
+
+# Provider clients are imported on first access so that only the SDK in use
+# gets loaded (PEP 562)
+_LAZY_CLIENTS = {
+    "GroqClient": ".groq_client",
+    "GrokClient": ".grok_client",
+    "OpenAIClient": ".openai_client",
+    "OpenAIBatchClient": ".openai_batch_client",
+    "FastOpenAIClient": ".fast_openai_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CLIENTS:
+        module = importlib.import_module(_LAZY_CLIENTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
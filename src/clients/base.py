@@ -1,16 +1,61 @@
 """Base class for LLM clients."""
 
+import inspect
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .http_pool import get_shared_http_client
 
 
 class BaseLLMClient(ABC):
-    """Abstract base class for LLM clients."""
+    """
+    Abstract base class for LLM clients.
+
+    Provider clients wrap an OpenAI-compatible chat completions SDK. They
+    set async_client_class and http_client_class, fill _client_kwargs with
+    the SDK constructor arguments, and build request bodies in
+    _request_body(); evaluate() and aevaluate() are shared.
+    """
+
+    # Transient SDK errors worth retrying, declared by each provider client
+    retryable_errors: tuple[type[Exception], ...] = ()
+
+    # Async SDK client class and the httpx client subclass it requires
+    # (e.g. AsyncOpenAI and openai.DefaultAsyncHttpxClient)
+    async_client_class: Callable[..., Any]
+    http_client_class: Callable[..., Any]
+
+    # Synchronous SDK client, built by each provider client
+    client: Any
 
     def __init__(self, model: str, temperature: float):
         self.model = model
         self.temperature = temperature
 
+        # SDK constructor arguments shared by the sync and async clients
+        self._client_kwargs: dict[str, Any] = {}
+
+        # The async client is tied to an event loop's HTTP pool, so it is
+        # built on first use in each loop (see async_client)
+        self._async_client: Any = None
+        self._async_http: Any = None
+
+    @property
+    def async_client(self) -> Any:
+        """Async SDK client using the running event loop's shared HTTP pool."""
+        http_client = get_shared_http_client(self.http_client_class)
+        if self._async_client is None or self._async_http is not http_client:
+            self._async_client = self.async_client_class(
+                **self._client_kwargs, http_client=http_client
+            )
+            self._async_http = http_client
+        return self._async_client
+
     @abstractmethod
+    def _request_body(self, ticket: str, reply: str) -> dict[str, Any]:
+        """Build chat completion request parameters for a ticket."""
+
     def evaluate(self, ticket: str, reply: str) -> str:
         """
         Send evaluation request to LLM.
@@ -22,4 +67,69 @@ class BaseLLMClient(ABC):
         Returns:
             Raw JSON string with evaluation result
         """
-        pass
+        response = self.client.chat.completions.create(
+            **self._request_body(ticket, reply)
+        )
+        return self._message_content(response)
+
+    async def aevaluate(
+        self,
+        ticket: str,
+        reply: str,
+        on_rate_limit: Callable[[int], None] | None = None,
+    ) -> str:
+        """
+        Send evaluation request to LLM without blocking the event loop.
+
+        Args:
+            ticket: Customer support ticket message
+            reply: AI-generated response
+            on_rate_limit: Called with the provider's
+                x-ratelimit-remaining-requests header, if present
+                (see AdaptiveConcurrencyLimiter)
+
+        Returns:
+            Raw JSON string with evaluation result
+        """
+        raw_response = (
+            await self.async_client.chat.completions.with_raw_response.create(
+                **self._request_body(ticket, reply)
+            )
+        )
+        self._report_rate_limit(raw_response.headers, on_rate_limit)
+        response = await self._parse_raw_response(raw_response)
+        return self._message_content(response)
+
+    @staticmethod
+    def _message_content(response: Any) -> str:
+        """Get the first choice's message content from a chat completion."""
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("LLM returned empty response")
+        return content
+
+    @staticmethod
+    async def _parse_raw_response(raw_response: Any) -> Any:
+        """
+        Parse a with_raw_response result into the completion object.
+
+        groq's AsyncAPIResponse.parse() is a coroutine while openai's
+        LegacyAPIResponse.parse() is synchronous, so await only when needed.
+        """
+        parsed = raw_response.parse()
+        if inspect.isawaitable(parsed):
+            parsed = await parsed
+        return parsed
+
+    @staticmethod
+    def _report_rate_limit(
+        headers: Mapping[str, str], on_rate_limit: Callable[[int], None] | None
+    ) -> None:
+        """Pass the remaining request count from response headers on."""
+        if on_rate_limit is None:
+            return
+        try:
+            remaining = int(headers["x-ratelimit-remaining-requests"])
+        except (KeyError, ValueError):
+            return  # Header missing or malformed
+        on_rate_limit(remaining)
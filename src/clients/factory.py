@@ -1,18 +1,36 @@
 """Factory for creating LLM clients."""
 
-from ..config import MODEL_CONFIGS, Provider
+import functools
+import hashlib
+import importlib
+
+from ..config import MODEL_CONFIGS, Provider, get_api_key
 from .base import BaseLLMClient
-from .groq_client import GroqClient
-from .grok_client import GrokClient
-from .openai_client import OpenAIClient
+
+# Client module and class for each provider, imported on first use
+_PROVIDER_CLIENTS: dict[Provider, tuple[str, str]] = {
+    Provider.GROQ: (".groq_client", "GroqClient"),
+    Provider.GROK: (".grok_client", "GrokClient"),
+    Provider.OPENAI: (".openai_client", "OpenAIClient"),
+}
 
 
-def create_client(mode: str) -> BaseLLMClient:
+def create_client(
+    mode: str, batch: bool = False, raw_http: bool = False
+) -> BaseLLMClient:
     """
     Create LLM client based on mode.
 
+    Clients are cached per mode and API key, so repeated calls share one
+    client. Its connections come from the running event loop's pool (see
+    http_pool), so a cached client keeps working across asyncio.run()
+    calls. API keys are read once per process (see get_api_key); after
+    get_api_key.cache_clear() a changed key gets a new client.
+
     Args:
         mode: Model mode (fast, balanced, deep, openai-fast, openai, openai-deep)
+        batch: Use the OpenAI Batch API client (OpenAI modes only)
+        raw_http: Bypass the SDK on the async path (OpenAI modes only)
 
     Returns:
         Configured LLM client instance
@@ -23,13 +41,49 @@ def create_client(mode: str) -> BaseLLMClient:
     if mode not in MODEL_CONFIGS:
         raise ValueError(f"Unknown mode: {mode}")
 
+    # Raises for a missing API key before anything is cached
+    api_key = get_api_key(MODEL_CONFIGS[mode].provider)
+    fingerprint = hashlib.sha256(api_key.encode()).hexdigest()
+    return _create_client(mode, batch, raw_http, fingerprint)
+
+
+def clear_client_cache() -> None:
+    """Drop cached clients so the next create_client() builds new ones."""
+    _create_client.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _create_client(
+    mode: str, batch: bool, raw_http: bool, api_key_fingerprint: str
+) -> BaseLLMClient:
+    """Build a client; api_key_fingerprint only takes part in the cache key."""
     config = MODEL_CONFIGS[mode]
 
-    if config.provider == Provider.GROQ:
-        return GroqClient(model=config.model, temperature=config.temperature)
-    elif config.provider == Provider.GROK:
-        return GrokClient(model=config.model, temperature=config.temperature)
-    elif config.provider == Provider.OPENAI:
-        return OpenAIClient(model=config.model, temperature=config.temperature)
-    else:
+    if batch and raw_http:
+        raise ValueError("Batch mode and raw HTTP mode can't be combined")
+
+    # Client modules are imported here so only the chosen SDK gets loaded
+    if raw_http:
+        if config.provider != Provider.OPENAI:
+            raise ValueError(
+                f"Raw HTTP mode is only supported for OpenAI models: {mode}"
+            )
+        from .fast_openai_client import FastOpenAIClient
+
+        return FastOpenAIClient(model=config.model, temperature=config.temperature)
+
+    if batch:
+        if config.provider != Provider.OPENAI:
+            raise ValueError(f"Batch mode is only supported for OpenAI models: {mode}")
+        from .openai_batch_client import OpenAIBatchClient
+
+        return OpenAIBatchClient(model=config.model, temperature=config.temperature)
+
+    if config.provider not in _PROVIDER_CLIENTS:
         raise ValueError(f"Unknown provider: {config.provider}")
+
+    module_name, class_name = _PROVIDER_CLIENTS[config.provider]
+    client_class: type[BaseLLMClient] = getattr(
+        importlib.import_module(module_name, __package__), class_name
+    )
+    return client_class(model=config.model, temperature=config.temperature)
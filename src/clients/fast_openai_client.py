@@ -0,0 +1,92 @@
+"""OpenAI client with a raw HTTP fast path."""
+
+from collections.abc import Callable
+
+import httpx
+
+from .http_pool import get_shared_http_client
+from .openai_client import OpenAIClient
+from ..json_utils import dumps, loads
+from ..prompts import build_evaluation_prompt
+
+
+class TransientHTTPError(Exception):
+    """Retryable HTTP status (429 or 5xx) returned on the raw HTTP path."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}: {response.text[:200]}")
+        # Read by the retry policy for the Retry-After header
+        self.response = response
+
+
+class FastOpenAIClient(OpenAIClient):
+    """
+    OpenAI client whose async path posts raw JSON through httpx.
+
+    The SDK validates every response into pydantic models, although only
+    the message content is used. This client skips that work and reads the
+    content straight from the JSON body. The synchronous evaluate() still
+    goes through the SDK.
+    """
+
+    retryable_errors = OpenAIClient.retryable_errors + (
+        httpx.TransportError,
+        TransientHTTPError,
+    )
+
+    def __init__(self, model: str, temperature: float):
+        super().__init__(model, temperature)
+
+        # Same endpoint as the SDK, which honors the OPENAI_BASE_URL variable
+        self._url = f"{str(self.client.base_url).rstrip('/')}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.client.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Everything but the user message is fixed, so it is serialized once
+        # and only the user message is encoded per request. The body is
+        # {<params>,"messages":[<system>?,<user>]}
+        params = self._request_body("", "")
+        messages = params.pop("messages")[:-1]
+        self._body_prefix = (
+            dumps(params)[:-1]
+            + b',"messages":['
+            + b"".join(dumps(message) + b"," for message in messages)
+        )
+        self._user_prefix = self._o1_prompt_prefix if self._is_o1 else ""
+
+    def _request_bytes(self, ticket: str, reply: str) -> bytes:
+        """Build the serialized request body for a ticket."""
+        user_message = {
+            "role": "user",
+            "content": self._user_prefix + build_evaluation_prompt(ticket, reply),
+        }
+        return self._body_prefix + dumps(user_message) + b"]}"
+
+    async def aevaluate(
+        self,
+        ticket: str,
+        reply: str,
+        on_rate_limit: Callable[[int], None] | None = None,
+    ) -> str:
+        """Send evaluation request to OpenAI over raw HTTP."""
+        http = get_shared_http_client(httpx.AsyncClient)
+        response = await http.post(
+            self._url,
+            content=self._request_bytes(ticket, reply),
+            headers=self._headers,
+        )
+        self._report_rate_limit(response.headers, on_rate_limit)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TransientHTTPError(response)
+        if response.status_code != 200:
+            raise ValueError(
+                f"OpenAI request failed with HTTP {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+
+        content = loads(response.content)["choices"][0]["message"]["content"]
+        if content is None:
+            raise ValueError("LLM returned empty response")
+        return content
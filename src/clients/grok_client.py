@@ -1,43 +1,68 @@
 """Grok (xAI) LLM client."""
 
-import os
+from typing import Any
 
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import (
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+)
 
 from .base import BaseLLMClient
-from ..prompts import SYSTEM_PROMPT, EVALUATION_TEMPLATE
+from ..config import Provider, get_api_key
+from ..prompts import SYSTEM_PROMPT, build_evaluation_prompt
 
 
 class GrokClient(BaseLLMClient):
     """Grok LLM client using xAI API."""
 
+    # Timeouts subclass APIConnectionError
+    retryable_errors: tuple[type[Exception], ...] = (
+        RateLimitError,
+        APIConnectionError,
+        InternalServerError,
+    )
+
+    async_client_class = AsyncOpenAI
+    http_client_class = DefaultAsyncHttpxClient
+
     def __init__(self, model: str, temperature: float):
         super().__init__(model, temperature)
 
-        api_key = os.getenv("XAI_API_KEY")
-        if not api_key:
-            raise ValueError("XAI_API_KEY environment variable not set")
+        api_key = get_api_key(Provider.GROK)
 
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.x.ai/v1",
-        )
+        # Identical on every call, so built once
+        self._system_message: ChatCompletionSystemMessageParam = {
+            "role": "system",
+            "content": SYSTEM_PROMPT,
+        }
+        # Request parameters that don't depend on the ticket
+        self._base: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": 500,
+            "response_format": {"type": "json_object"},
+        }
+
+        # Retries are left to the retry policy (see evaluator.retry_policy)
+        self._client_kwargs = {
+            "api_key": api_key,
+            "base_url": "https://api.x.ai/v1",
+            "max_retries": 0,
+        }
+        self.client = OpenAI(**self._client_kwargs)
 
-    def evaluate(self, ticket: str, reply: str) -> str:
-        """Send evaluation request to Grok."""
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": EVALUATION_TEMPLATE.format(ticket=ticket, reply=reply),
-                },
-            ],
-            temperature=self.temperature,
-            max_tokens=500,
+    def _request_body(self, ticket: str, reply: str) -> dict[str, Any]:
+        """Build chat completion request parameters for a ticket."""
+        messages: tuple[ChatCompletionMessageParam, ...] = (
+            self._system_message,
+            {"role": "user", "content": build_evaluation_prompt(ticket, reply)},
         )
-        content = response.choices[0].message.content
-        if content is None:
-            raise ValueError("LLM returned empty response")
-        return content
+        return {**self._base, "messages": messages}
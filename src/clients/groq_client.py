@@ -1,41 +1,64 @@
 """Groq LLM client."""
 
-import os
+from typing import Any
 
-from groq import Groq
+from groq import (
+    APIConnectionError,
+    AsyncGroq,
+    DefaultAsyncHttpxClient,
+    Groq,
+    InternalServerError,
+    RateLimitError,
+)
+from groq.types.chat import (
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+)
 
 from .base import BaseLLMClient
-from ..prompts import SYSTEM_PROMPT, EVALUATION_TEMPLATE
+from ..config import Provider, get_api_key
+from ..prompts import SYSTEM_PROMPT, build_evaluation_prompt
 
 
 class GroqClient(BaseLLMClient):
     """Groq LLM client using Llama models."""
 
+    # Timeouts subclass APIConnectionError
+    retryable_errors: tuple[type[Exception], ...] = (
+        RateLimitError,
+        APIConnectionError,
+        InternalServerError,
+    )
+
+    async_client_class = AsyncGroq
+    http_client_class = DefaultAsyncHttpxClient
+
     def __init__(self, model: str, temperature: float):
         super().__init__(model, temperature)
 
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY environment variable not set")
-
-        self.client = Groq(api_key=api_key)
-
-    def evaluate(self, ticket: str, reply: str) -> str:
-        """Send evaluation request to Groq."""
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": EVALUATION_TEMPLATE.format(ticket=ticket, reply=reply),
-                },
-            ],
-            temperature=self.temperature,
-            max_tokens=500,
-            response_format={"type": "json_object"},
+        api_key = get_api_key(Provider.GROQ)
+
+        # Identical on every call, so built once
+        self._system_message: ChatCompletionSystemMessageParam = {
+            "role": "system",
+            "content": SYSTEM_PROMPT,
+        }
+        # Request parameters that don't depend on the ticket
+        self._base: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": 500,
+            "response_format": {"type": "json_object"},
+        }
+
+        # Retries are left to the retry policy (see evaluator.retry_policy)
+        self._client_kwargs = {"api_key": api_key, "max_retries": 0}
+        self.client = Groq(**self._client_kwargs)
+
+    def _request_body(self, ticket: str, reply: str) -> dict[str, Any]:
+        """Build chat completion request parameters for a ticket."""
+        messages: tuple[ChatCompletionMessageParam, ...] = (
+            self._system_message,
+            {"role": "user", "content": build_evaluation_prompt(ticket, reply)},
         )
-        content = response.choices[0].message.content
-        if content is None:
-            raise ValueError("LLM returned empty response")
-        return content
+        return {**self._base, "messages": messages}
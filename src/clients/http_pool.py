@@ -0,0 +1,50 @@
+"""Shared HTTP connection pools for the async LLM clients."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+# httpx defaults (10 keep-alive / 100 total) throttle concurrent evaluation;
+# HTTP/2 lets many in-flight requests share one TLS connection per host.
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+# openai's DefaultAsyncHttpxClient is built on httpx2, which can't combine an
+# httpx.Timeout with its own timeouts, so it gets a plain overall timeout
+HTTP_TIMEOUT_SECONDS = 60.0
+
+_T = TypeVar("_T")
+
+# Connections belong to the loop that opened them, so pools are per loop
+_shared_clients: dict[tuple[asyncio.AbstractEventLoop, Callable[..., Any]], Any] = {}
+
+
+def get_shared_http_client(client_class: Callable[..., _T]) -> _T:
+    """
+    Get the running event loop's async HTTP client built by client_class.
+
+    Each SDK ships its own httpx.AsyncClient subclass with SDK defaults
+    (e.g. openai.DefaultAsyncHttpxClient), so one pool is kept per class.
+    Must be called from a coroutine.
+    """
+    key = (asyncio.get_running_loop(), client_class)
+    client = _shared_clients.get(key)
+    if client is None:
+        timeout = (
+            HTTP_TIMEOUT
+            if isinstance(client_class, type)
+            and issubclass(client_class, httpx.AsyncClient)
+            else HTTP_TIMEOUT_SECONDS
+        )
+        client = client_class(limits=HTTP_LIMITS, timeout=timeout, http2=True)
+        _shared_clients[key] = client
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close the running event loop's shared HTTP clients."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _shared_clients if key[0] is loop]
+    for key in keys:
+        await _shared_clients.pop(key).aclose()
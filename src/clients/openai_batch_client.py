@@ -0,0 +1,87 @@
+"""OpenAI Batch API client."""
+
+import json
+import time
+from typing import Final
+
+from .openai_client import OpenAIClient
+from ..models import TicketInput
+
+BATCH_ENDPOINT: Final = "/v1/chat/completions"
+
+# Terminal states of an OpenAI batch job
+_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatchClient(OpenAIClient):
+    """
+    OpenAI client that submits many tickets as a single Batch API job.
+
+    Batches cost 50% less than regular requests and are scheduled by
+    OpenAI within the completion window, so they suit large CSVs that
+    don't need results immediately.
+    """
+
+    poll_interval: float = 30.0
+
+    def batch_evaluate(self, tickets: list[TicketInput]) -> list[str | None]:
+        """
+        Evaluate tickets through the Batch API.
+
+        Args:
+            tickets: Tickets to evaluate
+
+        Returns:
+            Raw JSON response per ticket, in input order. None for tickets
+            whose request failed inside the batch.
+
+        Raises:
+            ValueError: If the batch job does not complete
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": f"t{i}",
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": self._request_body(t.ticket, t.reply),
+                }
+            )
+            for i, t in enumerate(tickets)
+        ]
+        batch_file = self.client.files.create(
+            file=("tickets.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        print(f"Submitted batch {batch.id} with {len(tickets)} tickets")
+
+        while batch.status not in _FINAL_STATUSES:
+            time.sleep(self.poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts is not None:
+                print(f"Batch {batch.status}: {counts.completed}/{counts.total} done")
+
+        if batch.status != "completed":
+            raise ValueError(f"Batch {batch.id} ended with status: {batch.status}")
+
+        responses: dict[str, str] = {}
+        if batch.output_file_id is not None:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response")
+                if response is None or response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                if content is not None:
+                    responses[record["custom_id"]] = content
+
+        return [responses.get(f"t{i}") for i in range(len(tickets))]
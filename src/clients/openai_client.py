@@ -1,59 +1,79 @@
 """OpenAI LLM client."""
 
-import os
+from typing import Any
 
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import (
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+)
 
 from .base import BaseLLMClient
-from ..prompts import SYSTEM_PROMPT, EVALUATION_TEMPLATE
+from ..config import Provider, get_api_key
+from ..prompts import SYSTEM_PROMPT, build_evaluation_prompt
 
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI LLM client using GPT models."""
 
+    # Timeouts subclass APIConnectionError
+    retryable_errors: tuple[type[Exception], ...] = (
+        RateLimitError,
+        APIConnectionError,
+        InternalServerError,
+    )
+
+    async_client_class = AsyncOpenAI
+    http_client_class = DefaultAsyncHttpxClient
+
     def __init__(self, model: str, temperature: float):
         super().__init__(model, temperature)
 
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
+        api_key = get_api_key(Provider.OPENAI)
 
-        self.client = OpenAI(api_key=api_key)
+        # Identical on every call, so built once
+        self._system_message: ChatCompletionSystemMessageParam = {
+            "role": "system",
+            "content": SYSTEM_PROMPT,
+        }
+        self._o1_prompt_prefix = SYSTEM_PROMPT + "\n\n"
 
-    def evaluate(self, ticket: str, reply: str) -> str:
-        """Send evaluation request to OpenAI."""
+        # Request parameters that don't depend on the ticket.
         # o1 models don't support system messages or temperature != 1
         # o1 uses reasoning tokens internally, needs more tokens (960+ for reasoning, ~60 for output)
-        if self.model.startswith("o1"):
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": SYSTEM_PROMPT
-                        + "\n\n"
-                        + EVALUATION_TEMPLATE.format(ticket=ticket, reply=reply),
-                    },
-                ],
-                max_completion_tokens=2000,
+        self._is_o1 = model.startswith("o1")
+        self._base: dict[str, Any]
+        if self._is_o1:
+            self._base = {"model": model, "max_completion_tokens": 2000}
+        else:
+            self._base = {
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": 500,
+                "response_format": {"type": "json_object"},
+            }
+
+        # Retries are left to the retry policy (see evaluator.retry_policy)
+        self._client_kwargs = {"api_key": api_key, "max_retries": 0}
+        self.client = OpenAI(**self._client_kwargs)
+
+    def _request_body(self, ticket: str, reply: str) -> dict[str, Any]:
+        """Build chat completion request parameters for a ticket."""
+        user_content = build_evaluation_prompt(ticket, reply)
+        if self._is_o1:
+            messages: tuple[ChatCompletionMessageParam, ...] = (
+                {"role": "user", "content": self._o1_prompt_prefix + user_content},
             )
         else:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {
-                        "role": "user",
-                        "content": EVALUATION_TEMPLATE.format(
-                            ticket=ticket, reply=reply
-                        ),
-                    },
-                ],
-                temperature=self.temperature,
-                max_tokens=500,
-                response_format={"type": "json_object"},
+            messages = (
+                self._system_message,
+                {"role": "user", "content": user_content},
             )
-        content = response.choices[0].message.content
-        if content is None:
-            raise ValueError("LLM returned empty response")
-        return content
+        return {**self._base, "messages": messages}
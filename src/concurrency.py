@@ -0,0 +1,73 @@
+"""Concurrency limiting that adapts to provider rate limits."""
+
+import asyncio
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit driven by the provider's rate-limit headers.
+
+    Works like an asyncio.Semaphore whose size can change while in use.
+    After each response the client reports how many requests are left in
+    the current rate-limit window (x-ratelimit-remaining-requests). When
+    fewer remain than the current limit, the limit is halved so the run
+    slows down before the provider starts answering 429; otherwise it grows
+    by one per response, back up to max_limit. A request rejected with 429
+    is reported as 0 remaining, since some providers' headers count a longer
+    window than the one that ran out.
+    """
+
+    def __init__(self, max_limit: int):
+        if max_limit < 1:
+            raise ValueError("max_limit must be at least 1")
+
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is free, then take it."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken and cancelled at once: pass the wake-up on
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Give a request slot back."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def observe(self, remaining_requests: int) -> None:
+        """Resize the limit from the remaining requests in the window."""
+        if remaining_requests < self.limit:
+            self.limit = max(1, self.limit // 2)
+        elif self.limit < self.max_limit:
+            self.limit += 1
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Wake as many waiting requests as there are free slots."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
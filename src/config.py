@@ -1,5 +1,7 @@
 """Configuration for LLM providers and models."""
 
+import functools
+import os
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,6 +21,7 @@ class ModelConfig:
     provider: Provider
     model: str
     temperature: float
+    max_concurrency: int = 16  # Max in-flight requests, tuned to rate limits
 
 
 MODEL_CONFIGS: dict[str, ModelConfig] = {
@@ -27,11 +30,13 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         provider=Provider.GROQ,
         model="llama-3.3-70b-versatile",
         temperature=0.1,
+        max_concurrency=32,
     ),
     "groq-balanced": ModelConfig(
         provider=Provider.GROQ,
         model="llama-3.3-70b-versatile",
         temperature=0.3,
+        max_concurrency=32,
     ),
     # Grok models (xAI)
     "grok-deep": ModelConfig(
@@ -54,6 +59,7 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
         provider=Provider.OPENAI,
         model="o1",
         temperature=1.0,  # o1 requires temperature=1
+        max_concurrency=4,  # o1 has much lower rate limits
     ),
 }
 
@@ -61,7 +67,49 @@ MODEL_CONFIGS: dict[str, ModelConfig] = {
 # Default mode
 DEFAULT_MODE = "groq-balanced"
 
+# Minimum ticket count before --batch uses the Batch API instead of live calls
+BATCH_THRESHOLD = 50
+
+# Environment variable holding each provider's API key
+API_KEY_ENV_VARS: dict[Provider, str] = {
+    Provider.GROQ: "GROQ_API_KEY",
+    Provider.GROK: "XAI_API_KEY",
+    Provider.OPENAI: "OPENAI_API_KEY",
+}
+
+# Environment variable overriding the per-mode concurrency limit
+MAX_CONCURRENCY_ENV = "LLM_MAX_CONCURRENCY"
+
 
 def get_available_modes() -> list[str]:
     """Get list of available model modes."""
     return list(MODEL_CONFIGS.keys())
+
+
+@functools.cache
+def get_api_key(provider: Provider) -> str:
+    """
+    Get a provider's API key from the environment.
+
+    The key is read once per process and then reused. Call
+    get_api_key.cache_clear() to pick up a changed key.
+
+    Raises:
+        ValueError: If the environment variable is not set (not cached)
+    """
+    env_var = API_KEY_ENV_VARS[provider]
+    api_key = os.getenv(env_var)
+    if not api_key:
+        raise ValueError(f"{env_var} environment variable not set")
+    return api_key
+
+
+def get_max_concurrency(mode: str) -> int:
+    """Get max in-flight requests for a mode, honoring LLM_MAX_CONCURRENCY."""
+    override = os.getenv(MAX_CONCURRENCY_ENV)
+    if override:
+        value = int(override)
+        if value < 1:
+            raise ValueError(f"{MAX_CONCURRENCY_ENV} must be at least 1")
+        return value
+    return MODEL_CONFIGS[mode].max_concurrency
@@ -1,35 +1,57 @@
 """CSV read/write operations."""
 
 import csv
+from collections.abc import Iterator
 
 from .models import TicketInput, TicketEvaluated
 
 
-def read_tickets(file_path: str) -> list[TicketInput]:
-    """Read tickets from CSV file."""
-    tickets = []
+def iter_tickets(file_path: str) -> Iterator[TicketInput]:
+    """
+    Stream tickets from a CSV file one row at a time.
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    Memory use stays constant regardless of file size. Header problems
+    raise ValueError when the first ticket is requested.
+    """
+    # newline="" lets the csv module handle line breaks inside quoted fields
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
 
         # Validate columns
-        if reader.fieldnames is None:
+        header = next(reader, None)
+        if header is None:
             raise ValueError(f"Empty CSV file: {file_path}")
 
         required_cols = {"ticket", "reply"}
-        missing = required_cols - set(reader.fieldnames)
+        missing = required_cols - set(header)
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
 
+        # Resolve column positions once instead of building a dict per row
+        ticket_idx = header.index("ticket")
+        reply_idx = header.index("reply")
+        min_len = max(ticket_idx, reply_idx) + 1
+
         for row_num, row in enumerate(reader, start=2):
-            ticket = row.get("ticket", "").strip()
-            reply = row.get("reply", "").strip()
+            if not row:
+                continue  # Blank line
+
+            if len(row) < min_len:
+                ticket = reply = ""
+            else:
+                ticket = row[ticket_idx].strip()
+                reply = row[reply_idx].strip()
 
             if not ticket or not reply:
                 print(f"Warning: Skipping empty row {row_num}")
                 continue
 
-            tickets.append(TicketInput(ticket=ticket, reply=reply))
+            yield TicketInput(ticket=ticket, reply=reply)
+
+
+def read_tickets(file_path: str) -> list[TicketInput]:
+    """Read all tickets from CSV file."""
+    tickets = list(iter_tickets(file_path))
 
     if not tickets:
         raise ValueError("No valid tickets found in CSV")
@@ -37,29 +59,55 @@ def read_tickets(file_path: str) -> list[TicketInput]:
     return tickets
 
 
+OUTPUT_FIELDNAMES = [
+    "ticket",
+    "reply",
+    "content_score",
+    "content_explanation",
+    "format_score",
+    "format_explanation",
+]
+
+
+class ResultWriter:
+    """
+    Write evaluation results to a CSV file one row at a time.
+
+    Use as a context manager so rows reach disk while evaluation is still
+    running, instead of holding every result until the end.
+    """
+
+    def __init__(self, file_path: str):
+        self._file = open(file_path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(OUTPUT_FIELDNAMES)
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, result: TicketEvaluated) -> None:
+        """Write a single evaluated ticket."""
+        self._writer.writerow(
+            (
+                result.ticket,
+                result.reply,
+                result.content_score,
+                result.content_explanation,
+                result.format_score,
+                result.format_explanation,
+            )
+        )
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self._file.close()
+
+
 def write_results(file_path: str, results: list[TicketEvaluated]) -> None:
     """Write evaluation results to CSV file."""
-    fieldnames = [
-        "ticket",
-        "reply",
-        "content_score",
-        "content_explanation",
-        "format_score",
-        "format_explanation",
-    ]
-
-    with open(file_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
+    with ResultWriter(file_path) as writer:
         for result in results:
-            writer.writerow(
-                {
-                    "ticket": result.ticket,
-                    "reply": result.reply,
-                    "content_score": result.content_score,
-                    "content_explanation": result.content_explanation,
-                    "format_score": result.format_score,
-                    "format_explanation": result.format_explanation,
-                }
-            )
+            writer.write(result)
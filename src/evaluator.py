@@ -1,68 +1,175 @@
 """Ticket evaluation logic."""
 
+import asyncio
+import contextlib
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, cast
+
 from tenacity import (
-    retry,
+    AsyncRetrying,
+    RetryCallState,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
 )
 
+from .cache import ResponseCache, make_cache_key
 from .clients.base import BaseLLMClient
+from .clients.http_pool import close_shared_http_clients
+from .concurrency import AdaptiveConcurrencyLimiter
+from .csv_handler import ResultWriter
 from .models import TicketInput, TicketEvaluated, EvaluationResult
-from .parser import parse_response
+from .parser import parse_response, parse_response_json
 
+if TYPE_CHECKING:
+    from .clients.openai_batch_client import OpenAIBatchClient
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=2, min=2, max=10),
-    retry=retry_if_exception_type((Exception,)),
-    reraise=True,
-)
-def evaluate_ticket_with_retry(
+# Default cap on in-flight requests when the caller doesn't pass one
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Upper bound on a provider-requested Retry-After delay, in seconds
+MAX_RETRY_AFTER = 60.0
+
+# Responses longer than this (in characters) are parsed in a worker thread
+# so the event loop keeps handling other requests; shorter ones are parsed
+# inline because the thread hand-off costs more than the parse
+PARSE_OFFLOAD_THRESHOLD = 2000
+
+# Jitter spreads out retries from concurrent tickets that failed together
+_backoff = wait_random_exponential(multiplier=1, max=30)
+
+
+def wait_with_retry_after(retry_state: RetryCallState) -> float:
+    """Back off with jitter, waiting at least as long as Retry-After asks."""
+    delay = _backoff(retry_state)
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(error, "response", None)
+    if response is None:
+        return delay
+
+    try:
+        retry_after = float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return delay  # Missing or an HTTP date
+    return max(delay, min(retry_after, MAX_RETRY_AFTER))
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether an SDK or raw HTTP error is a 429 response."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def retry_policy(client: BaseLLMClient) -> dict[str, Any]:
+    """
+    Build tenacity retry settings for a client.
+
+    Only the client's transient SDK errors are retried; anything else,
+    e.g. a bad API key or a rejected request, fails fast.
+    """
+    return {
+        "stop": stop_after_attempt(3),
+        "wait": wait_with_retry_after,
+        "retry": retry_if_exception_type(client.retryable_errors),
+        "reraise": True,
+    }
+
+
+async def parse_response_async(raw_response: str) -> EvaluationResult:
+    """Parse a response, offloading long ones to a worker thread."""
+    if len(raw_response) > PARSE_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(parse_response, raw_response)
+    return parse_response(raw_response)
+
+
+async def evaluate_ticket_with_retry_async(
     client: BaseLLMClient,
     ticket: str,
     reply: str,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None = None,
+    cache: ResponseCache | None = None,
+    on_rate_limit: Callable[[int], None] | None = None,
 ) -> EvaluationResult:
-    """Evaluate a single ticket with retry logic."""
-    raw_response = client.evaluate(ticket, reply)
-    return parse_response(raw_response)
+    """
+    Evaluate a single ticket asynchronously with retry logic.
 
+    The semaphore (or limiter) is only held while a request is in flight,
+    so tickets backing off between attempts don't occupy a concurrency slot.
+    on_rate_limit receives the remaining requests reported by the provider,
+    and 0 when a request is rejected with 429.
+    """
+    key = None
+    if cache is not None:
+        key = make_cache_key(client.model, client.temperature, ticket, reply)
+        cached = cache.get(key)
+        if cached is not None:
+            return await parse_response_async(cached)
 
-def evaluate_tickets(
-    tickets: list[TicketInput],
+    limit = semaphore if semaphore is not None else contextlib.nullcontext()
+
+    async for attempt in AsyncRetrying(**retry_policy(client)):
+        with attempt:
+            async with limit:
+                try:
+                    raw_response = await client.aevaluate(ticket, reply, on_rate_limit)
+                except Exception as e:
+                    # A 429 means the window is used up, even when the headers
+                    # disagree (Groq's remaining-requests count is per day)
+                    if on_rate_limit is not None and is_rate_limited(e):
+                        on_rate_limit(0)
+                    raise
+
+    result = await parse_response_async(raw_response)
+    if cache is not None and key is not None:
+        # Only well-formed responses are kept; one the regex fallback had to
+        # recover is asked for again on the next run. Parsed JSON is cached,
+        # so this doesn't parse the response twice
+        with contextlib.suppress(KeyError, TypeError, ValueError):
+            parse_response_json(raw_response)
+            cache.set(key, raw_response)
+    return result
+
+
+async def aevaluate_tickets(
+    tickets: Iterable[TicketInput],
     client: BaseLLMClient,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    writer: ResultWriter | None = None,
+    cache: ResponseCache | None = None,
 ) -> list[TicketEvaluated]:
-    """Evaluate all tickets."""
-    results = []
-    total = len(tickets)
+    """
+    Evaluate all tickets concurrently, preserving input order.
 
-    for i, ticket_input in enumerate(tickets, start=1):
-        print(f"Evaluating ticket {i}/{total}...", end=" ")
+    If a writer is given, each result is written as soon as it and every
+    ticket before it have finished, so the output file keeps input order.
+    Responses found in the cache are reused without calling the LLM, and
+    repeated (ticket, reply) pairs are evaluated only once.
+    max_concurrency is an upper bound: the client's rate-limit headers can
+    lower the effective concurrency while the run is in progress.
+    Any iterable of tickets is accepted; it is read into a list first.
+    """
+    if not isinstance(tickets, Sequence):
+        tickets = list(tickets)
+    total = len(tickets)
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency)
 
+    async def evaluate_one(
+        index: int, ticket_input: TicketInput
+    ) -> tuple[int, TicketEvaluated]:
+        i = index + 1
         try:
-            result = evaluate_ticket_with_retry(
+            result = await evaluate_ticket_with_retry_async(
                 client,
                 ticket_input.ticket,
                 ticket_input.reply,
+                limiter,
+                cache,
+                limiter.observe,
             )
-
-            evaluated = TicketEvaluated(
-                ticket=ticket_input.ticket,
-                reply=ticket_input.reply,
-                content_score=result.content_score,
-                content_explanation=result.content_explanation,
-                format_score=result.format_score,
-                format_explanation=result.format_explanation,
-            )
-            results.append(evaluated)
-            print(
-                f"Done (Content: {result.content_score}, Format: {result.format_score})"
-            )
-
         except Exception as e:
-            print(f"Failed after retries: {e}")
+            print(f"Ticket {i}/{total}: Failed after retries: {e}")
             # Add with default scores on failure
-            evaluated = TicketEvaluated(
+            return index, TicketEvaluated(
                 ticket=ticket_input.ticket,
                 reply=ticket_input.reply,
                 content_score=0,
@@ -70,6 +177,113 @@ def evaluate_tickets(
                 format_score=0,
                 format_explanation=f"Evaluation failed: {e}",
             )
-            results.append(evaluated)
+
+        print(
+            f"Ticket {i}/{total}: Done "
+            f"(Content: {result.content_score}, Format: {result.format_score})"
+        )
+        return index, TicketEvaluated(
+            ticket=ticket_input.ticket,
+            reply=ticket_input.reply,
+            content_score=result.content_score,
+            content_explanation=result.content_explanation,
+            format_score=result.format_score,
+            format_explanation=result.format_explanation,
+        )
+
+    # Positions of each distinct (ticket, reply) pair, keyed in input order
+    positions: dict[tuple[str, str], list[int]] = {}
+    for index, ticket_input in enumerate(tickets):
+        key = (ticket_input.ticket, ticket_input.reply)
+        positions.setdefault(key, []).append(index)
+
+    duplicates = total - len(positions)
+    if duplicates:
+        print(
+            f"Skipping {duplicates} duplicate tickets "
+            f"({duplicates / total:.0%} of {total})"
+        )
+    print(f"Evaluating {len(positions)} tickets (max {max_concurrency} concurrent)...")
+    # Filled in by position as tickets finish
+    results: list[TicketEvaluated | None] = [None] * total
+    next_to_write = 0
+
+    for next_done in asyncio.as_completed(
+        [
+            evaluate_one(indexes[0], tickets[indexes[0]])
+            for indexes in positions.values()
+        ]
+    ):
+        first_index, evaluated = await next_done
+        ticket_input = tickets[first_index]
+        for index in positions[(ticket_input.ticket, ticket_input.reply)]:
+            results[index] = evaluated
+
+        if writer is not None:
+            while next_to_write < total:
+                result = results[next_to_write]
+                if result is None:
+                    break
+                writer.write(result)
+                next_to_write += 1
+
+    # Every position is filled once all tickets have finished
+    return cast(list[TicketEvaluated], results)
+
+
+def evaluate_tickets(
+    tickets: Iterable[TicketInput],
+    client: BaseLLMClient,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    writer: ResultWriter | None = None,
+    cache: ResponseCache | None = None,
+) -> list[TicketEvaluated]:
+    """Evaluate all tickets concurrently from synchronous code."""
+
+    async def run() -> list[TicketEvaluated]:
+        # The pools die with this call's event loop, so close them with it
+        try:
+            return await aevaluate_tickets(
+                tickets, client, max_concurrency, writer, cache
+            )
+        finally:
+            await close_shared_http_clients()
+
+    return asyncio.run(run())
+
+
+def evaluate_tickets_batch(
+    tickets: list[TicketInput],
+    client: "OpenAIBatchClient",
+) -> list[TicketEvaluated]:
+    """Evaluate all tickets as a single OpenAI Batch API job."""
+    raw_responses = client.batch_evaluate(tickets)
+    results = []
+
+    for ticket_input, raw_response in zip(tickets, raw_responses):
+        if raw_response is None:
+            results.append(
+                TicketEvaluated(
+                    ticket=ticket_input.ticket,
+                    reply=ticket_input.reply,
+                    content_score=0,
+                    content_explanation="Evaluation failed: batch request failed",
+                    format_score=0,
+                    format_explanation="Evaluation failed: batch request failed",
+                )
+            )
+            continue
+
+        result = parse_response(raw_response)
+        results.append(
+            TicketEvaluated(
+                ticket=ticket_input.ticket,
+                reply=ticket_input.reply,
+                content_score=result.content_score,
+                content_explanation=result.content_explanation,
+                format_score=result.format_score,
+                format_explanation=result.format_explanation,
+            )
+        )
 
     return results
@@ -0,0 +1,35 @@
+"""JSON helpers backed by orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson (several times faster) if available, otherwise stdlib json.
+    Documents orjson rejects but stdlib json accepts (NaN, integers over
+    64 bits) are retried with stdlib json. Both raise json.JSONDecodeError
+    (orjson's error subclasses it).
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -38,3 +38,17 @@ AI REPLY:
 
 Provide your evaluation as JSON with this exact structure:
 {{"content_score": <integer 1-5>, "content_explanation": "<brief explanation, 1-2 sentences>", "format_score": <integer 1-5>, "format_explanation": "<brief explanation, 1-2 sentences>"}}"""
+
+
+# EVALUATION_TEMPLATE split once around its two fields, so each prompt is a
+# single join instead of a fresh parse of the template
+_EVALUATION_HEAD, _EVALUATION_MIDDLE, _EVALUATION_TAIL = EVALUATION_TEMPLATE.format(
+    ticket="\0", reply="\0"
+).split("\0")
+
+
+def build_evaluation_prompt(ticket: str, reply: str) -> str:
+    """Build the user prompt for a ticket; same as EVALUATION_TEMPLATE.format()."""
+    return "".join(
+        (_EVALUATION_HEAD, ticket, _EVALUATION_MIDDLE, reply, _EVALUATION_TAIL)
+    )
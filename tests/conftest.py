@@ -0,0 +1,170 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.clients import GroqClient
+from src.clients.factory import clear_client_cache
+from src.config import get_api_key
+from src.json_utils import dumps
+from src.parser import parse_response_json
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Keep cached clients, API keys and parse results from leaking between tests."""
+    clear_client_cache()
+    get_api_key.cache_clear()
+    parse_response_json.cache_clear()
+    yield
+    clear_client_cache()
+    get_api_key.cache_clear()
+    parse_response_json.cache_clear()
+
+
+@pytest.fixture
+def make_response():
+    """Build a chat completion stub whose only field is the message content."""
+
+    def make(content):
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    return make
+
+
+class FakeChatCompletions:
+    """
+    Stand-in for the Groq SDK's chat.completions.with_raw_response.
+
+    score and delay are values or functions of the user prompt. Records the
+    prompts it was sent and how many requests were in flight as each one
+    started (started_with).
+    """
+
+    def __init__(self, make_response, score, format_score, delay, headers):
+        self._make_response = make_response
+        self._score = score
+        self._format_score = format_score
+        self._delay = delay
+        self._headers = headers or {}
+        self._in_flight = 0
+        self.prompts: list[str] = []
+        self.started_with: list[int] = []
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        self.prompts.append(prompt)
+        self._in_flight += 1
+        self.started_with.append(self._in_flight)
+        try:
+            delay = self._delay(prompt) if callable(self._delay) else self._delay
+            await asyncio.sleep(delay)
+        finally:
+            self._in_flight -= 1
+
+        score = self._score(prompt) if callable(self._score) else self._score
+        format_score = self._format_score if self._format_score is not None else score
+        content = dumps(
+            {
+                "content_score": score,
+                "content_explanation": "E",
+                "format_score": format_score,
+                "format_explanation": "E",
+            }
+        ).decode()
+        # Like groq's AsyncAPIResponse, whose parse() is a coroutine
+        return SimpleNamespace(
+            headers=self._headers,
+            parse=AsyncMock(return_value=self._make_response(content)),
+        )
+
+
+@pytest.fixture
+def fake_groq(monkeypatch, make_response):
+    """
+    Replace the async Groq SDK with a FakeChatCompletions.
+
+    Call it as fake_groq(score=..., format_score=..., delay=..., headers=...);
+    it returns the fake so tests can inspect the requests it received.
+    """
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+
+    def configure(score=4, format_score=None, delay=0, headers=None):
+        fake = FakeChatCompletions(make_response, score, format_score, delay, headers)
+        async_groq = MagicMock()
+        async_groq.return_value.chat.completions.with_raw_response.create = fake.create
+        monkeypatch.setattr(GroqClient, "async_client_class", async_groq)
+        return fake
+
+    return configure
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """
+    Answer every POST like a provider's chat completions API.
+
+    Replies with a fixed completion, or with an error when the server's
+    state.status is set to something other than 200. Counts the requests
+    it receives in state.requests.
+    """
+
+    body = json.dumps(
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test-model",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {
+                        "role": "assistant",
+                        "content": '{"content_score": 4, "format_score": 5}',
+                    },
+                }
+            ],
+        }
+    ).encode()
+    error_body = b'{"error": {"message": "Rate limit reached"}}'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        state = self.server.state
+        state.requests += 1
+        body = self.body if state.status == 200 else self.error_body
+        self.send_response(state.status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.send_header("x-ratelimit-remaining-requests", "100")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def llm_server():
+    """
+    Run a local chat completions server.
+
+    Yields its state: url (the base URL), status (the HTTP status to answer
+    with, 200 by default) and requests (how many it has received).
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    server.state = SimpleNamespace(
+        url=f"http://127.0.0.1:{server.server_port}", status=200, requests=0
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.state
+    server.shutdown()
+    server.server_close()
@@ -1,22 +1,32 @@
 """Unit tests for ticket evaluation system."""
 
+import asyncio
 import csv
 import json
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.models import TicketEvaluated
-from src.config import MODEL_CONFIGS, get_available_modes
-from src.csv_handler import read_tickets, write_results
+from src.cache import ResponseCache, make_cache_key
+from src.concurrency import AdaptiveConcurrencyLimiter
+from src.models import EvaluationResult, TicketEvaluated, TicketInput
+from src.config import MODEL_CONFIGS, get_available_modes, get_max_concurrency
+from src.json_utils import dumps
+from src.csv_handler import ResultWriter, read_tickets, write_results
 from src.parser import (
     clamp_score,
     parse_response,
     parse_response_json,
     parse_response_regex,
 )
-from src.clients import create_client, GroqClient, GrokClient, OpenAIClient
+from src.clients import (
+    create_client,
+    GroqClient,
+    GrokClient,
+    OpenAIClient,
+    OpenAIBatchClient,
+)
 
 
 # =============================================================================
@@ -46,6 +56,72 @@ class TestConfig:
         assert "groq-fast" in modes
         assert "openai-balanced" in modes
 
+    def test_get_max_concurrency_default(self):
+        """Test per-mode concurrency default."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_max_concurrency("openai-deep") == 4
+
+    @patch.dict(os.environ, {"LLM_MAX_CONCURRENCY": "3"})
+    def test_get_max_concurrency_env_override(self):
+        """Test LLM_MAX_CONCURRENCY overrides the per-mode default."""
+        assert get_max_concurrency("groq-fast") == 3
+
+
+# =============================================================================
+# Test: Prompts
+# =============================================================================
+
+
+class TestPrompts:
+    """Tests for prompt building."""
+
+    def test_build_evaluation_prompt_matches_template(self):
+        """Test that the pre-split prompt equals the formatted template."""
+        from src.prompts import EVALUATION_TEMPLATE, build_evaluation_prompt
+
+        ticket = "Order {id} missing"
+        reply = 'We\'re on it: {"status": "shipped"}'
+
+        assert build_evaluation_prompt(ticket, reply) == EVALUATION_TEMPLATE.format(
+            ticket=ticket, reply=reply
+        )
+
+
+# =============================================================================
+# Test: Models
+# =============================================================================
+
+
+class TestModels:
+    """Tests for the data models."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            TicketInput(ticket="T", reply="R"),
+            EvaluationResult(
+                content_score=4,
+                content_explanation="Good",
+                format_score=5,
+                format_explanation="Great",
+            ),
+            TicketEvaluated(
+                ticket="T",
+                reply="R",
+                content_score=4,
+                content_explanation="Good",
+                format_score=5,
+                format_explanation="Great",
+            ),
+        ],
+    )
+    def test_models_are_slotted_and_picklable(self, model):
+        """Test that models carry no per-instance __dict__ and still pickle."""
+        import pickle
+
+        assert not hasattr(model, "__dict__")
+        assert pickle.loads(pickle.dumps(model)) == model
+
 
 # =============================================================================
 # Test: CSV Reading
@@ -68,6 +144,18 @@ class TestReadTickets:
         assert tickets[1].ticket == "Help me"
         assert tickets[1].reply == "Sure thing"
 
+    def test_iter_tickets_streams_rows(self, tmp_path):
+        """Test that tickets are yielded lazily, keeping multi-line fields."""
+        from src.csv_handler import iter_tickets
+
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_bytes(b'ticket,reply\r\n"Line one\r\nline two","Hi"\r\nB,R\r\n')
+
+        tickets = iter_tickets(str(csv_file))
+
+        assert next(tickets) == TicketInput(ticket="Line one\r\nline two", reply="Hi")
+        assert list(tickets) == [TicketInput(ticket="B", reply="R")]
+
     def test_read_csv_missing_columns(self, tmp_path):
         """Test error when required columns are missing."""
         csv_file = tmp_path / "test.csv"
@@ -95,6 +183,18 @@ class TestReadTickets:
         assert tickets[0].ticket == "Hello"
         assert tickets[1].ticket == "Bye"
 
+    def test_read_csv_skips_short_rows(self, tmp_path):
+        """Test that rows missing the reply column are skipped."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text('reply,ticket\n"Hi","Hello"\n"Orphan"\n\n"Bye","Leaving"')
+
+        tickets = read_tickets(str(csv_file))
+
+        assert [(t.ticket, t.reply) for t in tickets] == [
+            ("Hello", "Hi"),
+            ("Leaving", "Bye"),
+        ]
+
     def test_read_csv_file_not_found(self):
         """Test error when file doesn't exist."""
         with pytest.raises(FileNotFoundError):
@@ -176,14 +276,14 @@ class TestParseResponse:
 
     def test_parse_valid_json(self):
         """Test parsing valid JSON response."""
-        response = json.dumps(
+        response = dumps(
             {
                 "content_score": 4,
                 "content_explanation": "Good response",
                 "format_score": 5,
                 "format_explanation": "Well formatted",
             }
-        )
+        ).decode()
 
         result = parse_response_json(response)
 
@@ -194,14 +294,14 @@ class TestParseResponse:
 
     def test_parse_json_clamps_high_score(self):
         """Test that scores above 5 are clamped."""
-        response = json.dumps(
+        response = dumps(
             {
                 "content_score": 10,
                 "content_explanation": "Test",
                 "format_score": 5,
                 "format_explanation": "Test",
             }
-        )
+        ).decode()
 
         result = parse_response_json(response)
 
@@ -209,20 +309,63 @@ class TestParseResponse:
 
     def test_parse_json_clamps_low_score(self):
         """Test that scores below 1 are clamped."""
-        response = json.dumps(
+        response = dumps(
             {
                 "content_score": 0,
                 "content_explanation": "Test",
                 "format_score": -1,
                 "format_explanation": "Test",
             }
-        )
+        ).decode()
 
         result = parse_response_json(response)
 
         assert result.content_score == 1
         assert result.format_score == 1
 
+    @patch("src.json_utils.HAS_ORJSON", False)
+    def test_parse_valid_json_without_orjson(self):
+        """Test parsing falls back to stdlib json when orjson is missing."""
+        response = dumps(
+            {
+                "content_score": 2,
+                "content_explanation": "Weak",
+                "format_score": 3,
+                "format_explanation": "OK",
+            }
+        ).decode()
+
+        result = parse_response_json(response)
+
+        assert result.content_score == 2
+        assert result.format_explanation == "OK"
+
+    def test_loads_accepts_what_only_stdlib_json_parses(self):
+        """Test that documents orjson rejects are retried with stdlib json."""
+        from src.json_utils import loads
+
+        assert loads('{"score": NaN, "big": 18446744073709551616}')["big"] == 2**64
+        with pytest.raises(json.JSONDecodeError):
+            loads("not json")
+
+    def test_parse_json_reuses_result_for_identical_response(self):
+        """Test that an identical response is parsed only once."""
+        response = dumps(
+            {
+                "content_score": 4,
+                "content_explanation": "Good",
+                "format_score": 4,
+                "format_explanation": "Good",
+            }
+        ).decode()
+
+        with patch("src.parser.loads", wraps=json.loads) as mock_loads:
+            first = parse_response_json(response)
+            second = parse_response_json(response)
+
+        assert first is second
+        mock_loads.assert_called_once()
+
     def test_parse_regex_fallback(self):
         """Test regex fallback for malformed JSON."""
         # Malformed JSON-like response
@@ -233,6 +376,34 @@ class TestParseResponse:
         assert result.content_score == 4
         assert result.format_score == 3
 
+    def test_parse_regex_single_quoted_keys_and_negative_scores(self):
+        """Test regex fallback on Python-style output with out-of-range scores."""
+        response = (
+            "{'content_score': -2, 'content_explanation': \"Off topic\", "
+            "'format_score': 7, 'format_explanation': \"Tidy\"}"
+        )
+
+        result = parse_response_regex(response)
+
+        assert result.content_score == 1
+        assert result.format_score == 5
+        assert result.content_explanation == "Off topic"
+        assert result.format_explanation == "Tidy"
+
+    def test_parse_regex_first_match_wins(self):
+        """Test that the first well-typed occurrence of each field is used."""
+        response = (
+            '"content_score": "high", "content_score": 2, "content_score": 5, '
+            '"format_explanation": "First", "format_explanation": "Second"'
+        )
+
+        result = parse_response_regex(response)
+
+        assert result.content_score == 2
+        assert result.format_score == 3
+        assert result.content_explanation == "Unable to parse explanation"
+        assert result.format_explanation == "First"
+
     def test_parse_response_uses_fallback(self):
         """Test that parse_response falls back to regex on invalid JSON."""
         response = "not valid json but content_score: 5"
@@ -241,6 +412,17 @@ class TestParseResponse:
 
         assert result.content_score == 5
 
+    def test_parse_response_skips_json_for_non_object(self):
+        """Test that responses not starting with '{' go straight to regex."""
+        response = '```json\n{"content_score": 2, "format_score": 4}\n```'
+
+        with patch("src.parser.parse_response_json") as mock_json:
+            result = parse_response(response)
+
+        mock_json.assert_not_called()
+        assert result.content_score == 2
+        assert result.format_score == 4
+
     def test_clamp_score_in_range(self):
         """Test clamp_score with value in range."""
         assert clamp_score(3) == 3
@@ -256,6 +438,201 @@ class TestParseResponse:
         assert clamp_score(100) == 5
 
 
+# =============================================================================
+# Test: Retry Policy
+# =============================================================================
+
+
+class TestRetryPolicy:
+    """Tests for evaluation retry behavior."""
+
+    VALID_RESPONSE = dumps(
+        {
+            "content_score": 4,
+            "content_explanation": "Good",
+            "format_score": 4,
+            "format_explanation": "Good",
+        }
+    ).decode()
+
+    @pytest.mark.asyncio
+    @patch("src.evaluator.wait_with_retry_after", return_value=0)
+    async def test_retries_transient_errors(self, _mock_wait):
+        """Test that connection errors are retried."""
+        import openai
+
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        client = MagicMock(retryable_errors=OpenAIClient.retryable_errors)
+        client.aevaluate = AsyncMock(
+            side_effect=[
+                openai.APIConnectionError(request=MagicMock()),
+                self.VALID_RESPONSE,
+            ]
+        )
+
+        result = await evaluate_ticket_with_retry_async(client, "t", "r")
+
+        assert result.content_score == 4
+        assert client.aevaluate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_permanent_errors(self):
+        """Test that non-transient errors fail on the first attempt."""
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        client = MagicMock(retryable_errors=OpenAIClient.retryable_errors)
+        client.aevaluate = AsyncMock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError, match="bad request"):
+            await evaluate_ticket_with_retry_async(client, "t", "r")
+
+        client.aevaluate.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "client_class, env",
+        [
+            (OpenAIClient, {"OPENAI_API_KEY": "test_key"}),
+            (GroqClient, {"GROQ_API_KEY": "test_key"}),
+        ],
+    )
+    @patch("src.evaluator.wait_with_retry_after", return_value=0)
+    def test_rate_limited_ticket_sends_one_request_per_attempt(
+        self, _mock_wait, client_class, env, llm_server, monkeypatch
+    ):
+        """Test that the SDKs don't retry on top of the retry policy."""
+        from src.clients.http_pool import close_shared_http_clients
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{llm_server.url}/v1")
+        monkeypatch.setenv("GROQ_BASE_URL", llm_server.url)
+        llm_server.status = 429
+
+        async def run():
+            client = client_class(model="test-model", temperature=0.1)
+            try:
+                await evaluate_ticket_with_retry_async(client, "ticket", "reply")
+            finally:
+                await close_shared_http_clients()
+
+        with pytest.raises(client_class.retryable_errors):
+            asyncio.run(run())
+        assert llm_server.requests == 3
+
+    def test_wait_honors_retry_after(self):
+        """Test that the Retry-After header sets a minimum delay."""
+        from src.evaluator import wait_with_retry_after
+
+        error = Exception("rate limited")
+        error.response = MagicMock(headers={"retry-after": "7"})
+        retry_state = MagicMock(attempt_number=1)
+        retry_state.outcome.exception.return_value = error
+
+        assert wait_with_retry_after(retry_state) >= 7
+
+    @pytest.mark.asyncio
+    async def test_long_responses_parsed_off_event_loop(self):
+        """Test that only long responses are parsed in a worker thread."""
+        from src.evaluator import PARSE_OFFLOAD_THRESHOLD, parse_response_async
+
+        long_response = self.VALID_RESPONSE + " " * PARSE_OFFLOAD_THRESHOLD
+
+        with patch(
+            "src.evaluator.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as mock_to_thread:
+            short = await parse_response_async(self.VALID_RESPONSE)
+            long = await parse_response_async(long_response)
+
+        assert short == long
+        mock_to_thread.assert_called_once_with(parse_response, long_response)
+
+
+# =============================================================================
+# Test: Response Cache
+# =============================================================================
+
+
+class TestResponseCache:
+    """Tests for the persistent response cache."""
+
+    def test_cache_round_trip(self, tmp_path):
+        """Test that stored responses persist across cache instances."""
+        path = str(tmp_path / "cache.sqlite3")
+        key = make_cache_key("model", 0.1, "ticket", "reply")
+
+        with ResponseCache(path) as cache:
+            assert cache.get(key) is None
+            cache.set(key, '{"content_score": 4}')
+
+        with ResponseCache(path) as cache:
+            assert cache.get(key) == '{"content_score": 4}'
+
+    def test_cache_key_includes_temperature(self):
+        """Test that modes sharing a model don't share cache entries."""
+        assert make_cache_key("model", 0.1, "t", "r") != make_cache_key(
+            "model", 0.3, "t", "r"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm_call(self, tmp_path):
+        """Test that a cached response is reused without calling the LLM."""
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        client = MagicMock(model="model", temperature=0.1)
+        client.aevaluate = AsyncMock(
+            return_value=dumps(
+                {
+                    "content_score": 4,
+                    "content_explanation": "Good",
+                    "format_score": 5,
+                    "format_explanation": "Great",
+                }
+            ).decode()
+        )
+
+        with ResponseCache(str(tmp_path / "cache.sqlite3")) as cache:
+            first = await evaluate_ticket_with_retry_async(
+                client, "t", "r", cache=cache
+            )
+            second = await evaluate_ticket_with_retry_async(
+                client, "t", "r", cache=cache
+            )
+
+        assert first == second
+        client.aevaluate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_not_cached(self, tmp_path):
+        """Test that a response needing the regex fallback is asked for again."""
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        client = MagicMock(model="model", temperature=0.1)
+        client.aevaluate = AsyncMock(return_value="content_score: 2")
+
+        with ResponseCache(str(tmp_path / "cache.sqlite3")) as cache:
+            await evaluate_ticket_with_retry_async(client, "t", "r", cache=cache)
+            await evaluate_ticket_with_retry_async(client, "t", "r", cache=cache)
+
+            assert cache.get(make_cache_key("model", 0.1, "t", "r")) is None
+        assert client.aevaluate.await_count == 2
+
+    def test_rerun_with_cache_skips_llm_calls(self, fake_groq, tmp_path):
+        """Test that a second run over the same tickets is served from cache."""
+        from src.evaluator import evaluate_tickets
+
+        fake = fake_groq(score=4)
+        tickets = [TicketInput(ticket=f"T{i}", reply="R") for i in range(3)]
+
+        with ResponseCache(str(tmp_path / "cache.sqlite3")) as cache:
+            first = evaluate_tickets(tickets, create_client("groq-fast"), cache=cache)
+            second = evaluate_tickets(tickets, create_client("groq-fast"), cache=cache)
+
+        assert len(fake.prompts) == 3
+        assert first == second
+
+
 # =============================================================================
 # Test: LLM Clients
 # =============================================================================
@@ -308,6 +685,105 @@ class TestCreateClient:
         assert client.model == "gpt-4o-mini"
         assert client.temperature == 0.1
 
+    @patch.dict(os.environ, {"GROQ_API_KEY": "test_key"})
+    def test_create_client_is_cached(self):
+        """Test that repeated calls for a mode reuse one client."""
+        assert create_client("groq-fast") is create_client("groq-fast")
+        assert create_client("groq-fast") is not create_client("groq-balanced")
+
+    def test_create_client_new_api_key_builds_new_client(self):
+        """Test that changing the API key bypasses the cached client."""
+        from src.config import get_api_key
+
+        with patch.dict(os.environ, {"GROQ_API_KEY": "first_key"}):
+            first = create_client("groq-fast")
+        get_api_key.cache_clear()
+        with patch.dict(os.environ, {"GROQ_API_KEY": "second_key"}):
+            second = create_client("groq-fast")
+
+        assert first is not second
+
+    def test_create_client_missing_key_not_cached(self):
+        """Test that a missing API key error isn't remembered."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="GROQ_API_KEY"):
+                create_client("groq-fast")
+        with patch.dict(os.environ, {"GROQ_API_KEY": "test_key"}):
+            assert isinstance(create_client("groq-fast"), GroqClient)
+
+
+class TestHttpPool:
+    """Tests for the shared async HTTP client pool."""
+
+    def test_shared_http_client_reused_until_closed(self):
+        """Test that clients share one pool per class until it is closed."""
+        import httpx
+
+        from src.clients.http_pool import (
+            close_shared_http_clients,
+            get_shared_http_client,
+        )
+
+        async def run():
+            first = get_shared_http_client(httpx.AsyncClient)
+            assert get_shared_http_client(httpx.AsyncClient) is first
+
+            await close_shared_http_clients()
+
+            assert first.is_closed
+            second = get_shared_http_client(httpx.AsyncClient)
+            assert second is not first
+            await close_shared_http_clients()
+            return second
+
+        # Each event loop gets its own pool
+        assert asyncio.run(run()) is not asyncio.run(run())
+
+    def test_httpx_pool_keeps_connect_timeout(self):
+        """Test that plain httpx pools fail fast on connect."""
+        import httpx
+
+        from src.clients.http_pool import (
+            close_shared_http_clients,
+            get_shared_http_client,
+        )
+
+        async def run():
+            client = get_shared_http_client(httpx.AsyncClient)
+            await close_shared_http_clients()
+            return client.timeout
+
+        timeout = asyncio.run(run())
+        assert timeout.connect == 5.0
+        assert timeout.read == 60.0
+
+    @pytest.mark.parametrize(
+        "client_class, env",
+        [
+            (OpenAIClient, {"OPENAI_API_KEY": "test_key"}),
+            (GroqClient, {"GROQ_API_KEY": "test_key"}),
+        ],
+    )
+    def test_sdk_clients_send_through_shared_pool(
+        self, client_class, env, llm_server, monkeypatch
+    ):
+        """Test a real request through the shared pool the SDK clients use."""
+        from src.clients.http_pool import close_shared_http_clients
+
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{llm_server.url}/v1")
+        monkeypatch.setenv("GROQ_BASE_URL", llm_server.url)
+
+        async def run():
+            client = client_class(model="test-model", temperature=0.1)
+            try:
+                return await client.aevaluate("ticket", "reply")
+            finally:
+                await close_shared_http_clients()
+
+        assert asyncio.run(run()) == '{"content_score": 4, "format_score": 5}'
+
 
 class TestGroqClient:
     """Tests for GroqClient."""
@@ -321,15 +797,14 @@ class TestGroqClient:
 
     @patch.dict(os.environ, {"GROQ_API_KEY": "test_key"})
     @patch("src.clients.groq_client.Groq")
-    def test_groq_client_evaluate(self, mock_groq_class):
+    def test_groq_client_evaluate(self, mock_groq_class, make_response):
         """Test Groq client evaluate method."""
         # Setup mock
         mock_client = MagicMock()
         mock_groq_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices[
-            0
-        ].message.content = '{"content_score": 4, "content_explanation": "Good", "format_score": 5, "format_explanation": "Great"}'
+        mock_response = make_response(
+            '{"content_score": 4, "content_explanation": "Good", "format_score": 5, "format_explanation": "Great"}'
+        )
         mock_client.chat.completions.create.return_value = mock_response
 
         client = GroqClient(model="test-model", temperature=0.1)
@@ -341,6 +816,19 @@ class TestGroqClient:
         )
         mock_client.chat.completions.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_groq_client_aevaluate(self, fake_groq):
+        """Test Groq client async evaluate method."""
+        fake = fake_groq(score=3, headers={"x-ratelimit-remaining-requests": "42"})
+        on_rate_limit = MagicMock()
+
+        client = GroqClient(model="test-model", temperature=0.1)
+        result = await client.aevaluate("ticket", "reply", on_rate_limit)
+
+        assert json.loads(result)["content_score"] == 3
+        assert len(fake.prompts) == 1
+        on_rate_limit.assert_called_once_with(42)
+
 
 class TestGrokClient:
     """Tests for GrokClient."""
@@ -354,15 +842,14 @@ class TestGrokClient:
 
     @patch.dict(os.environ, {"XAI_API_KEY": "test_key"})
     @patch("src.clients.grok_client.OpenAI")
-    def test_grok_client_evaluate(self, mock_openai_class):
+    def test_grok_client_evaluate(self, mock_openai_class, make_response):
         """Test Grok client evaluate method."""
         # Setup mock
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices[
-            0
-        ].message.content = '{"content_score": 5, "content_explanation": "Excellent", "format_score": 4, "format_explanation": "Good"}'
+        mock_response = make_response(
+            '{"content_score": 5, "content_explanation": "Excellent", "format_score": 4, "format_explanation": "Good"}'
+        )
         mock_client.chat.completions.create.return_value = mock_response
 
         client = GrokClient(model="test-model", temperature=0.2)
@@ -376,6 +863,7 @@ class TestGrokClient:
         mock_openai_class.assert_called_once_with(
             api_key="test_key",
             base_url="https://api.x.ai/v1",
+            max_retries=0,
         )
 
 
@@ -391,15 +879,14 @@ class TestOpenAIClient:
 
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
     @patch("src.clients.openai_client.OpenAI")
-    def test_openai_client_evaluate(self, mock_openai_class):
+    def test_openai_client_evaluate(self, mock_openai_class, make_response):
         """Test OpenAI client evaluate method."""
         # Setup mock
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices[
-            0
-        ].message.content = '{"content_score": 4, "content_explanation": "Good", "format_score": 4, "format_explanation": "Good"}'
+        mock_response = make_response(
+            '{"content_score": 4, "content_explanation": "Good", "format_score": 4, "format_explanation": "Good"}'
+        )
         mock_client.chat.completions.create.return_value = mock_response
 
         client = OpenAIClient(model="gpt-4o", temperature=0.2)
@@ -412,6 +899,268 @@ class TestOpenAIClient:
         mock_client.chat.completions.create.assert_called_once()
 
 
+class TestFastOpenAIClient:
+    """Tests for FastOpenAIClient."""
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    def test_create_raw_http_client(self):
+        """Test creating the raw HTTP client for OpenAI mode."""
+        from src.clients import FastOpenAIClient
+
+        client = create_client("openai-fast", raw_http=True)
+
+        assert isinstance(client, FastOpenAIClient)
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("src.clients.fast_openai_client.get_shared_http_client")
+    async def test_fast_client_aevaluate(self, mock_get_http):
+        """Test that content is read straight from the raw JSON body."""
+        import httpx
+
+        from src.clients import FastOpenAIClient
+
+        mock_http = mock_get_http.return_value
+        mock_http.post = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                content=dumps(
+                    {"choices": [{"message": {"content": '{"content_score": 5}'}}]}
+                ),
+            )
+        )
+
+        client = FastOpenAIClient(model="gpt-4o-mini", temperature=0.1)
+        result = await client.aevaluate("ticket", "reply")
+
+        assert result == '{"content_score": 5}'
+        kwargs = mock_http.post.call_args.kwargs
+        assert kwargs["headers"]["Authorization"] == "Bearer test_key"
+        assert json.loads(kwargs["content"]) == json.loads(
+            json.dumps(client._request_body("ticket", "reply"))
+        )
+
+    @pytest.mark.parametrize("model", ["gpt-4o-mini", "o1"])
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    def test_fast_client_prebuilt_body_matches_sdk_body(self, model):
+        """Test that the pre-serialized body equals the SDK request body."""
+        from src.clients import FastOpenAIClient
+
+        client = FastOpenAIClient(model=model, temperature=0.1)
+        body = client._request_bytes('Ticket "quoted"', "Réponse\nline")
+
+        assert json.loads(body) == json.loads(
+            json.dumps(client._request_body('Ticket "quoted"', "Réponse\nline"))
+        )
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("src.clients.fast_openai_client.get_shared_http_client")
+    async def test_fast_client_rate_limit_is_retryable(self, mock_get_http):
+        """Test that HTTP 429 raises a retryable error."""
+        import httpx
+
+        from src.clients import FastOpenAIClient
+
+        mock_get_http.return_value.post = AsyncMock(
+            return_value=httpx.Response(429, headers={"retry-after": "2"})
+        )
+
+        client = FastOpenAIClient(model="gpt-4o-mini", temperature=0.1)
+        with pytest.raises(client.retryable_errors) as exc_info:
+            await client.aevaluate("ticket", "reply")
+
+        assert exc_info.value.response.headers["retry-after"] == "2"
+
+
+class TestOpenAIBatchClient:
+    """Tests for OpenAIBatchClient."""
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    def test_create_batch_client(self):
+        """Test creating batch client for OpenAI mode."""
+        client = create_client("openai-fast", batch=True)
+
+        assert isinstance(client, OpenAIBatchClient)
+        assert client.model == "gpt-4o-mini"
+
+    @patch.dict(os.environ, {"GROQ_API_KEY": "test_key"})
+    def test_create_batch_client_non_openai(self):
+        """Test error when batch mode is requested for non-OpenAI mode."""
+        with pytest.raises(ValueError, match="only supported for OpenAI"):
+            create_client("groq-fast", batch=True)
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("src.clients.openai_client.OpenAI")
+    def test_batch_evaluate(self, mock_openai_class):
+        """Test batch upload and mapping of results back to tickets."""
+
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.batches.create.return_value = MagicMock(
+            id="batch_1", status="completed", output_file_id="file_out"
+        )
+        # Results come back out of order; t1 failed
+        mock_client.files.content.return_value.text = "\n".join(
+            [
+                dumps(
+                    {
+                        "custom_id": "t2",
+                        "response": {
+                            "status_code": 200,
+                            "body": {"choices": [{"message": {"content": "third"}}]},
+                        },
+                    }
+                ).decode(),
+                dumps(
+                    {
+                        "custom_id": "t0",
+                        "response": {
+                            "status_code": 200,
+                            "body": {"choices": [{"message": {"content": "first"}}]},
+                        },
+                    }
+                ).decode(),
+                dumps({"custom_id": "t1", "response": {"status_code": 500}}).decode(),
+            ]
+        )
+
+        client = OpenAIBatchClient(model="gpt-4o-mini", temperature=0.1)
+        tickets = [TicketInput(ticket=f"T{i}", reply="R") for i in range(3)]
+        result = client.batch_evaluate(tickets)
+
+        assert result == ["first", None, "third"]
+        upload = mock_client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        assert len(upload["file"][1].splitlines()) == 3
+        mock_client.batches.create.assert_called_once_with(
+            input_file_id=mock_client.files.create.return_value.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+
+# =============================================================================
+# Test: Adaptive Concurrency
+# =============================================================================
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_limit_halves_when_few_requests_remain(self):
+        """Test that the limit shrinks when the window is nearly used up."""
+
+        limiter = AdaptiveConcurrencyLimiter(8)
+
+        limiter.observe(3)
+        assert limiter.limit == 4
+        limiter.observe(0)
+        limiter.observe(0)
+        limiter.observe(0)
+        assert limiter.limit == 1
+
+    def test_limit_grows_back_to_max(self):
+        """Test that the limit recovers one step at a time up to the maximum."""
+
+        limiter = AdaptiveConcurrencyLimiter(4)
+        limiter.observe(0)
+
+        limiter.observe(100)
+        assert limiter.limit == 3
+        limiter.observe(100)
+        limiter.observe(100)
+        assert limiter.limit == 4
+
+    def test_invalid_max_limit(self):
+        """Test that a limit below one is rejected."""
+
+        with pytest.raises(ValueError, match="at least 1"):
+            AdaptiveConcurrencyLimiter(0)
+
+    @pytest.mark.asyncio
+    @patch("src.evaluator.wait_with_retry_after", return_value=0)
+    async def test_rate_limit_error_halves_limit(self, _mock_wait):
+        """Test that a 429 shrinks the limit even without rate-limit headers."""
+        import openai
+
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        limiter = AdaptiveConcurrencyLimiter(8)
+        client = MagicMock(retryable_errors=OpenAIClient.retryable_errors)
+        client.aevaluate = AsyncMock(
+            side_effect=[
+                openai.RateLimitError(
+                    "rate limited", response=MagicMock(status_code=429), body=None
+                ),
+                TestRetryPolicy.VALID_RESPONSE,
+            ]
+        )
+
+        await evaluate_ticket_with_retry_async(
+            client, "t", "r", limiter, on_rate_limit=limiter.observe
+        )
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    @patch("src.evaluator.wait_with_retry_after", return_value=0)
+    async def test_raw_http_429_halves_limit(self, _mock_wait):
+        """Test that a 429 on the raw HTTP path shrinks the limit too."""
+        import httpx
+
+        from src.clients.fast_openai_client import TransientHTTPError
+        from src.evaluator import evaluate_ticket_with_retry_async
+
+        limiter = AdaptiveConcurrencyLimiter(8)
+        client = MagicMock(retryable_errors=(TransientHTTPError,))
+        client.aevaluate = AsyncMock(
+            side_effect=[
+                TransientHTTPError(httpx.Response(429)),
+                TransientHTTPError(httpx.Response(503)),
+                TestRetryPolicy.VALID_RESPONSE,
+            ]
+        )
+
+        await evaluate_ticket_with_retry_async(
+            client, "t", "r", limiter, on_rate_limit=limiter.observe
+        )
+
+        # Only the 429 counts; a 503 isn't a rate limit
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_waiters_resume_when_limit_grows(self):
+        """Test that raising the limit lets waiting requests start."""
+
+        limiter = AdaptiveConcurrencyLimiter(2)
+        limiter.observe(0)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.observe(100)
+        await asyncio.wait_for(waiter, timeout=1)
+        limiter.release()
+        limiter.release()
+
+    def test_rate_limit_headers_lower_concurrency(self, fake_groq):
+        """Test that a nearly exhausted rate limit serializes requests."""
+        from src.evaluator import evaluate_tickets
+
+        fake = fake_groq(delay=0.01, headers={"x-ratelimit-remaining-requests": "0"})
+
+        client = create_client("groq-fast")
+        tickets = [TicketInput(ticket=f"T{i}", reply="R") for i in range(8)]
+        results = evaluate_tickets(tickets, client, 4)
+
+        assert len(results) == 8
+        # Once the headers report no remaining requests, they run one at a time
+        assert fake.started_with == [1, 2, 3, 4, 1, 1, 1, 1]
+
+
 # =============================================================================
 # Test: Integration
 # =============================================================================
@@ -420,29 +1169,14 @@ class TestOpenAIClient:
 class TestIntegration:
     """Integration tests with mocked LLM."""
 
-    @patch.dict(os.environ, {"GROQ_API_KEY": "test_key"})
-    @patch("src.clients.groq_client.Groq")
-    def test_full_flow(self, mock_groq_class, tmp_path):
+    def test_full_flow(self, fake_groq, tmp_path):
         """Test complete evaluation flow with mocked LLM."""
         from src.evaluator import evaluate_tickets
 
         # Create input file
         input_file = tmp_path / "input.csv"
         input_file.write_text('ticket,reply\n"Test ticket","Test reply"')
-
-        # Setup mock
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = json.dumps(
-            {
-                "content_score": 4,
-                "content_explanation": "Good content",
-                "format_score": 5,
-                "format_explanation": "Great format",
-            }
-        )
-        mock_client.chat.completions.create.return_value = mock_response
+        fake_groq(score=4, format_score=5)
 
         # Run evaluation
         tickets = read_tickets(str(input_file))
@@ -453,3 +1187,109 @@ class TestIntegration:
         assert len(results) == 1
         assert results[0].content_score == 4
         assert results[0].format_score == 5
+
+    def test_full_flow_streamed_tickets(self, fake_groq, tmp_path):
+        """Test evaluating tickets straight from the streaming CSV reader."""
+        from src.csv_handler import iter_tickets
+        from src.evaluator import evaluate_tickets
+
+        input_file = tmp_path / "input.csv"
+        input_file.write_text("ticket,reply\nA,R\nB,R\n")
+        fake_groq(score=3)
+
+        results = evaluate_tickets(
+            iter_tickets(str(input_file)), create_client("groq-fast")
+        )
+
+        assert [r.ticket for r in results] == ["A", "B"]
+
+    def test_full_flow_preserves_order(self, fake_groq):
+        """Test that concurrent evaluation returns results in input order."""
+        from src.evaluator import evaluate_tickets
+
+        # Later tickets finish first
+        fake_groq(
+            score=lambda prompt: 1 if "first" in prompt else 5,
+            delay=lambda prompt: 0.02 if "first" in prompt else 0,
+        )
+
+        tickets = [
+            TicketInput(ticket="first", reply="R"),
+            TicketInput(ticket="second", reply="R"),
+        ]
+        results = evaluate_tickets(tickets, create_client("groq-fast"))
+
+        assert [r.ticket for r in results] == ["first", "second"]
+        assert [r.content_score for r in results] == [1, 5]
+
+    def test_full_flow_respects_max_concurrency(self, fake_groq):
+        """Test that no more than max_concurrency requests are in flight."""
+        from src.evaluator import evaluate_tickets
+
+        fake = fake_groq(delay=0.01)
+
+        tickets = [TicketInput(ticket=f"T{i}", reply="R") for i in range(6)]
+        results = evaluate_tickets(tickets, create_client("groq-fast"), 2)
+
+        assert len(results) == 6
+        assert max(fake.started_with) == 2
+
+    def test_full_flow_evaluates_duplicates_once(self, fake_groq):
+        """Test that repeated (ticket, reply) pairs share one LLM call."""
+        from src.evaluator import evaluate_tickets
+
+        fake = fake_groq(score=4)
+
+        tickets = [
+            TicketInput(ticket="A", reply="R"),
+            TicketInput(ticket="B", reply="R"),
+            TicketInput(ticket="A", reply="R"),
+            TicketInput(ticket="A", reply="Other"),
+        ]
+        results = evaluate_tickets(tickets, create_client("groq-fast"))
+
+        assert len(fake.prompts) == 3
+        assert [(r.ticket, r.reply) for r in results] == [
+            ("A", "R"),
+            ("B", "R"),
+            ("A", "R"),
+            ("A", "Other"),
+        ]
+        assert all(r.content_score == 4 for r in results)
+
+    def test_full_flow_streams_to_writer(self, fake_groq, tmp_path):
+        """Test that results are streamed to the writer in input order."""
+        from src.evaluator import evaluate_tickets
+
+        # First ticket finishes last
+        fake_groq(delay=lambda prompt: 0.02 if "T0" in prompt else 0)
+
+        output_file = tmp_path / "output.csv"
+        tickets = [TicketInput(ticket=f"T{i}", reply="R") for i in range(3)]
+        with ResultWriter(str(output_file)) as writer:
+            evaluate_tickets(tickets, create_client("groq-fast"), writer=writer)
+
+        with open(output_file, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        assert [row["ticket"] for row in rows] == ["T0", "T1", "T2"]
+
+    @pytest.mark.parametrize("raw_http", [False, True])
+    def test_back_to_back_runs_share_cached_client(
+        self, raw_http, llm_server, monkeypatch
+    ):
+        """Test that a cached client still works after a previous run's pools close."""
+        from src.evaluator import evaluate_tickets
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{llm_server.url}/v1")
+        tickets = [TicketInput(ticket="T", reply="R")]
+
+        for _ in range(2):
+            client = create_client("openai-fast", raw_http=raw_http)
+            results = evaluate_tickets(tickets, client)
+
+            assert results[0].content_score == 4
+            assert results[0].format_score == 5
+
+        assert create_client("openai-fast", raw_http=raw_http) is client